@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Callable
 from unittest import TestCase
 
+from pypika.terms import Parameter
+
 from tydb.fields import BoolField, DateTimeField, FloatField, IntField, Nullable, StrField
 from tydb.models import Expr, Table
 
@@ -61,3 +63,33 @@ class TestExprParams(TestCase):
     
     def test_expr(self, sql: str, expr: Callable[[], Expr]):
         self.assertEqual(str(expr().pk_frag), sql)
+
+
+@parametise(
+    ('"int"=?', [1], lambda: Model.int == 1),
+    ('"int" IN (?,?)', [1, 2], lambda: Model.int @ [1, 2]),
+    ('"str" IS NULL', [], lambda: Model.str == None),
+    ('"date"=?', [NOW.isoformat()], lambda: Model.date == NOW),
+    ('("int"=? OR "int"=?) AND "str"=?', [1, 2, "A"], lambda: ((Model.int == 1) | (Model.int == 2)) & (Model.str == "A")),
+    ('"ref_id"=?', [1], lambda: Model.ref == INST),
+)
+class TestExprTemplate(TestCase):
+
+    def test_template(self, sql: str, values: list, expr: Callable[[], Expr]):
+        params: list = []
+        shape = expr().shape(params)
+        self.assertIsNotNone(shape)
+        self.assertEqual(params, values)
+        self.assertEqual(str(expr().pk_template(Parameter("?"))), sql)
+        self.assertEqual(expr().shape([]), shape)
+
+
+class TestExprShape(TestCase):
+
+    def test_shape_values(self):
+        self.assertEqual((Model.int == 1).shape([]), (Model.int == 2).shape([]))
+        self.assertNotEqual((Model.int == 1).shape([]), (Model.float == 1).shape([]))
+        self.assertNotEqual((Model.int @ [1]).shape([]), (Model.int @ [1, 2]).shape([]))
+
+    def test_shape_term(self):
+        self.assertIsNone((Model.int == Parameter("?")).shape([]))
@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from tydb.fields import BoolField, Default, IntField, Nullable
 from tydb.models import BoundReference, Collection, Reference, Table
-from tydb.session import AsyncSession, Session
+from tydb.session import BATCH_SIZE, AsyncSession, Session
 from tydb.utils import maybe_await
 
 try:
@@ -28,8 +28,13 @@ class NullOuter(Table, primary="key"):
     inner_key = Nullable.IntField(foreign=Inner.key)
     inner = Nullable.Reference(inner_key, Inner, backref="null_outers")
 
+class Nested(Table, primary="key"):
+    key = IntField(default=Default.SERVER)
+    outer_key = IntField(foreign=Outer.key)
+    outer = Reference(outer_key, Outer)
+
 
-@with_dialects(Inner, Outer, NullOuter)
+@with_dialects(Inner, Outer, NullOuter, Nested)
 class TestFieldReference(TestCase):
 
     async def test_get_joined(self, sess: Union[Session, AsyncSession]):
@@ -37,16 +42,65 @@ class TestFieldReference(TestCase):
         inner = await maybe_await(sess.get(Inner))
         await maybe_await(sess.create(Outer, inner_key=inner.key))
         outer = await maybe_await(sess.get(Outer, None, auto_join=True))
+        # Joined instances are constructed on first access.
+        self.assertNotIn("value", vars(outer.inner))
         self.assertEqual(inner, outer.inner.value)
+        self.assertIn("value", vars(outer.inner))
         self.assertEqual(inner, await maybe_await(sess.load(outer.inner)))
 
+    async def test_get_joined_nested(self, sess: Union[Session, AsyncSession]):
+        await maybe_await(sess.create(Inner))
+        inner = await maybe_await(sess.get(Inner))
+        await maybe_await(sess.create(Outer, inner_key=inner.key))
+        outer = await maybe_await(sess.get(Outer))
+        await maybe_await(sess.create(Nested, outer_key=outer.key))
+        nested = await maybe_await(sess.get(Nested, None, auto_join=True))
+        self.assertEqual(outer, nested.outer.value)
+        self.assertEqual(inner, nested.outer.value.inner.value)
+
+    async def test_bulk_create_instance(self, sess: Union[Session, AsyncSession]):
+        await maybe_await(sess.create(Inner))
+        inner = await maybe_await(sess.get(Inner))
+        await maybe_await(sess.bulk_create([NullOuter.inner_key], [inner], [None]))
+        outers = [outer async for outer in await maybe_await(sess.select(NullOuter))]
+        self.assertEqual([outer.inner_key for outer in outers], [inner.key, None])
+
     async def test_get_reference(self, sess: Union[Session, AsyncSession]):
         await maybe_await(sess.create(Inner))
         inner = await maybe_await(sess.get(Inner))
         await maybe_await(sess.create(Outer, inner_key=inner.key))
         outer = await maybe_await(sess.get(Outer, None))
         self.assertIsInstance(outer.inner, BoundReference)
+        self.assertFalse(outer.inner.fetched)
         self.assertEqual(inner, await maybe_await(sess.load(outer.inner)))
+        self.assertTrue(outer.inner.fetched)
+
+    async def test_load_many(self, sess: Union[Session, AsyncSession]):
+        await maybe_await(sess.create(Inner))
+        await maybe_await(sess.create(Inner, value=True))
+        first, second = [inner async for inner in await maybe_await(sess.select(Inner))]
+        await maybe_await(sess.bulk_create([Outer.inner_key], [first.key], [second.key], [first.key]))
+        await maybe_await(sess.bulk_create([NullOuter.inner_key], [second.key], [None]))
+        outers = [outer async for outer in await maybe_await(sess.select(Outer))]
+        null_outers = [outer async for outer in await maybe_await(sess.select(NullOuter))]
+        binds = [outer.inner for outer in outers + null_outers]
+        await maybe_await(sess.load_many(*binds))
+        self.assertTrue(all(bind.fetched for bind in binds))
+        self.assertEqual([bind.value for bind in binds], [first, second, first, second, None])
+        self.assertIs(binds[0].value, binds[2].value)
+
+    async def test_load_many_batches(self, sess: Union[Session, AsyncSession]):
+        count = BATCH_SIZE + 1
+        await maybe_await(sess.bulk_create([Inner.value], *([False] for _ in range(count))))
+        await maybe_await(sess.bulk_create([Outer.inner_key], *([key] for key in range(1, count + 1))))
+        outers = [outer async for outer in await maybe_await(sess.select(Outer))]
+        await maybe_await(sess.load_many(*(outer.inner for outer in outers)))
+        self.assertEqual([outer.inner.value.key for outer in outers], list(range(1, count + 1)))
+
+    async def test_load_many_missing(self, sess: Union[Session, AsyncSession]):
+        outer = Outer(key=1, inner_key=1)
+        with self.assertRaises(LookupError):
+            await maybe_await(sess.load_many(outer.inner))
 
     async def test_collection(self, sess: Union[Session, AsyncSession]):
         await maybe_await(sess.create(Inner))
@@ -66,6 +120,12 @@ class TestFieldReference(TestCase):
         self.assertIsNone(outer.inner.value)
         self.assertIsNone(await maybe_await(sess.load(outer.inner)))
 
+    async def test_nullable_load_null(self, sess: Union[Session, AsyncSession]):
+        await maybe_await(sess.create(NullOuter))
+        outer = await maybe_await(sess.get(NullOuter, None))
+        self.assertIsInstance(outer.inner, Nullable.BoundReference)
+        self.assertIsNone(await maybe_await(sess.load(outer.inner)))
+
     async def test_nullable_get_joined(self, sess: Union[Session, AsyncSession]):
         await maybe_await(sess.create(Inner))
         inner = await maybe_await(sess.get(Inner))
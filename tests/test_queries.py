@@ -2,9 +2,12 @@ from datetime import datetime
 from typing import Union
 from unittest import TestCase
 
+from pypika.terms import ValueWrapper
+
 from tydb.fields import Default, IntField, Nullable
 from tydb.models import Table
-from tydb.session import AsyncSession, Session
+from tydb.queries import AsyncSelectQuery, DeleteOneQuery
+from tydb.session import BATCH_SIZE, AsyncSession, Session
 from tydb.utils import maybe_await
 
 try:
@@ -21,7 +24,16 @@ class Model(Table, primary="id"):
     text = Nullable.StrField()
 
 
-@with_dialects(Model)
+class Keyless(Table):
+    number = IntField()
+    text = Nullable.StrField()
+
+
+class Serial(Table, primary="id"):
+    id = IntField(default=Default.SERVER)
+
+
+@with_dialects(Model, Keyless, Serial)
 class TestQueries(TestCase):
 
     async def test_create(self, sess: Union[AsyncSession, Session]):
@@ -38,6 +50,23 @@ class TestQueries(TestCase):
         self.assertEqual(insts[0], Model(id=1, text=None))
         self.assertEqual(insts[1], Model(id=2, text="Text"))
 
+    async def test_bulk_create_term(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Keyless.number], [ValueWrapper(3)]))
+        result = await maybe_await(sess.select(Keyless))
+        self.assertEqual([item async for item in result], [Keyless(number=3, text=None)])
+
+    async def test_create_many(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.create_many(Model, {}, {"text": "Text"}, {"id": 5, "text": "More"}))
+        result = await maybe_await(sess.select(Model))
+        insts = sorted([item async for item in result], key=lambda inst: inst.id)
+        self.assertEqual([inst.text for inst in insts], [None, "Text", "More"])
+        self.assertEqual(insts[-1].id, 5)
+
+    async def test_create_many_defaults(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.create_many(Serial, {}, {}))
+        result = await maybe_await(sess.select(Serial))
+        self.assertEqual([item async for item in result], [Serial(id=1), Serial(id=2)])
+
     async def test_select(self, sess: Union[AsyncSession, Session]):
         await maybe_await(sess.create(Model))
         result = await maybe_await(sess.select(Model))
@@ -45,6 +74,54 @@ class TestQueries(TestCase):
         self.assertEqual(len(insts), 1)
         self.assertEqual(insts[0], Model(id=1, text=None))
 
+    async def test_select_truthy(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
+        # Results are always truthy, without fetching any rows.
+        self.assertTrue(await maybe_await(sess.select(Model, Model.id == 3)))
+        result = await maybe_await(sess.select(Model))
+        self.assertTrue(result)
+        self.assertFalse(result.iterating or result.done)
+        insts = [item async for item in result]
+        self.assertEqual(insts, [Model(id=1, text=None), Model(id=2, text="Text")])
+
+    async def test_select_fetch_all(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
+        result = await maybe_await(sess.select(Model))
+        insts = await maybe_await(result.fetch_all())
+        self.assertEqual(insts, [Model(id=1, text=None), Model(id=2, text="Text")])
+        self.assertEqual([item async for item in result], insts)
+        self.assertEqual(await maybe_await(result.fetch_all()), insts)
+
+    async def test_select_pipeline(self, sess: Union[AsyncSession, Session]):
+        if not isinstance(sess, AsyncSession):
+            self.skipTest("Pipelining only applies to asynchronous results")
+        await sess.bulk_create([Model.text], [None], ["Text"], ["More"])
+        query = AsyncSelectQuery(sess.dialect, Model)
+        result = await query.execute(await maybe_await(sess.conn.cursor()), prefetch=2, pipeline=True)
+        insts = [item async for item in result]
+        self.assertEqual([inst.id for inst in insts], [1, 2, 3])
+
+    async def test_select_pipeline_break(self, sess: Union[AsyncSession, Session]):
+        if not isinstance(sess, AsyncSession):
+            self.skipTest("Pipelining only applies to asynchronous results")
+        await sess.bulk_create([Model.text], [None], ["Text"], ["More"])
+        query = AsyncSelectQuery(sess.dialect, Model)
+        result = await query.execute(await maybe_await(sess.conn.cursor()), prefetch=1, pipeline=True)
+        async for inst in result:
+            break
+        await result.aclose()
+        self.assertIsNone(result._pending)
+        self.assertEqual([item async for item in result], [Model(id=1, text=None)])
+
+    async def test_select_interleaved(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
+        result = await maybe_await(sess.select(Model))
+        ids = []
+        async for inst in result:
+            ids.append(inst.id)
+            await maybe_await(sess.get(Model, Model.id == inst.id))
+        self.assertEqual(ids, [1, 2])
+
     async def test_select_where(self, sess: Union[AsyncSession, Session]):
         await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
         result = await maybe_await(sess.select(Model, Model.id == 1))
@@ -111,6 +188,17 @@ class TestQueries(TestCase):
         self.assertEqual(len(insts), 1)
         self.assertEqual(insts[0], Model(id=2, text="Text"))
 
+    async def test_remove_keyless(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Keyless.number, Keyless.text], [1, None], [1, "Text"], [2, None]))
+        await maybe_await(sess.remove(Keyless(number=1, text=None)))
+        await maybe_await(sess.remove(Keyless(number=1, text="Text")))
+        result = await maybe_await(sess.select(Keyless))
+        insts = [item async for item in result]
+        self.assertEqual(insts, [Keyless(number=2, text=None)])
+        # Statements are kept per table, one for each combination of null fields.
+        keys = [key for key in Keyless.meta.query_cache if key[:2] == (DeleteOneQuery, sess.dialect)]
+        self.assertEqual(len(keys), 2)
+
     async def test_delete(self, sess: Union[AsyncSession, Session]):
         await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
         await maybe_await(sess.delete(Model, 1))
@@ -118,3 +206,108 @@ class TestQueries(TestCase):
         insts = [item async for item in result]
         self.assertEqual(len(insts), 1)
         self.assertEqual(insts[0], Model(id=2, text="Text"))
+
+    async def test_remove_tables(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Model.text], [None], ["Text"]))
+        await maybe_await(sess.create(Keyless, number=1))
+        model = await maybe_await(sess.get(Model, Model.id == 2))
+        keyless = await maybe_await(sess.get(Keyless))
+        await maybe_await(sess.remove(model, keyless))
+        self.assertEqual([item async for item in await maybe_await(sess.select(Model))], [Model(id=1, text=None)])
+        self.assertEqual([item async for item in await maybe_await(sess.select(Keyless))], [])
+
+    async def test_delete_batches(self, sess: Union[AsyncSession, Session]):
+        count = BATCH_SIZE + 2
+        await maybe_await(sess.bulk_create([Model.text], *([None] for _ in range(count))))
+        await maybe_await(sess.delete(Model, *range(1, count)))
+        result = await maybe_await(sess.select(Model))
+        insts = [item async for item in result]
+        self.assertEqual(insts, [Model(id=count, text=None)])
+
+    async def test_batch(self, sess: Union[AsyncSession, Session]):
+        batch = sess.batch()
+        batch.create(Model, text="One")
+        batch.create(Keyless, number=1)
+        batch.create(Model, text="Two")
+        batch.delete(Model, 1)
+        batch.create(Model, text="Three")
+        await maybe_await(batch.flush())
+        result = await maybe_await(sess.select(Model))
+        insts = [item async for item in result]
+        self.assertEqual([inst.text for inst in insts], ["Two", "Three"])
+        result = await maybe_await(sess.select(Keyless))
+        self.assertEqual([item async for item in result], [Keyless(number=1, text=None)])
+
+    async def test_batch_remove_keyless(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Keyless.number], [1], [2], [3]))
+        batch = sess.batch()
+        batch.remove(Keyless(number=1, text=None))
+        batch.remove(Keyless(number=2, text=None))
+        await maybe_await(batch.flush())
+        result = await maybe_await(sess.select(Keyless))
+        self.assertEqual([item async for item in result], [Keyless(number=3, text=None)])
+
+    async def test_batch_defaults(self, sess: Union[AsyncSession, Session]):
+        batch = sess.batch()
+        batch.create(Serial)
+        batch.create(Serial)
+        await maybe_await(batch.flush())
+        result = await maybe_await(sess.select(Serial))
+        self.assertEqual([item async for item in result], [Serial(id=1), Serial(id=2)])
+
+    async def test_batch_flush_error(self, sess: Union[AsyncSession, Session]):
+        batch = sess.batch()
+        batch.create(Model, text="One")
+        batch.create(Keyless)
+        batch.create(Model, text="Two")
+        with self.assertRaises(KeyError):
+            await maybe_await(batch.flush())
+        # Writes after the failed one are kept for another attempt.
+        self.assertEqual(len(batch._ops), 2)
+        result = await maybe_await(sess.select(Model))
+        self.assertEqual([item.text async for item in result], ["One"])
+
+    async def test_batch_flush_partial(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.create(Model, text="Old"))
+        batch = sess.batch()
+        batch.create(Model, text="One")
+        batch.create(Model, id=1, text="Dup")
+        with self.assertRaises(RuntimeError):
+            await maybe_await(batch.flush())
+        # Only the write that failed is left queued, so retrying doesn't repeat the first insert.
+        await maybe_await(sess.delete(Model, 1))
+        await maybe_await(batch.flush())
+        result = await maybe_await(sess.select(Model))
+        insts = sorted([item async for item in result], key=lambda inst: inst.id)
+        self.assertEqual(insts, [Model(id=1, text="Dup"), Model(id=2, text="One")])
+
+    async def test_batch_order(self, sess: Union[AsyncSession, Session]):
+        batch = sess.batch()
+        batch.create(Model, text="One")
+        batch.create(Model, id=5, text="Five")
+        batch.create(Model, text="Two")
+        await maybe_await(batch.flush())
+        result = await maybe_await(sess.select(Model))
+        insts = sorted([item async for item in result], key=lambda inst: inst.id)
+        self.assertEqual([inst.text for inst in insts], ["One", "Five", "Two"])
+
+    async def test_batch_error(self, sess: Union[AsyncSession, Session]):
+        with self.assertRaises(ValueError):
+            if isinstance(sess, AsyncSession):
+                async with sess.batch() as batch:
+                    batch.create(Model, text="One")
+                    raise ValueError
+            else:
+                with sess.batch() as batch:
+                    batch.create(Model, text="One")
+                    raise ValueError
+        result = await maybe_await(sess.select(Model))
+        self.assertEqual([item async for item in result], [])
+
+    async def test_delete_mixed(self, sess: Union[AsyncSession, Session]):
+        await maybe_await(sess.bulk_create([Model.text], [None], ["Text"], ["More"]))
+        inst = await maybe_await(sess.get(Model, Model.id == 1))
+        await maybe_await(sess.delete(Model, inst, 3))
+        result = await maybe_await(sess.select(Model))
+        insts = [item async for item in result]
+        self.assertEqual(insts, [Model(id=2, text="Text")])
@@ -3,7 +3,9 @@ from unittest import TestCase
 
 import pypika as pk
 
-from tydb.models import Field, Reference, Table
+from tydb.fields import BoolField, IntField
+from tydb.models import QUERY_CACHE_SIZE, Default, Field, Reference, Table
+from tydb.queries import _select_transform
 from tydb.utils import resolve_late_descriptors
 
 
@@ -49,6 +51,76 @@ class TestTable(TestCase):
         Model.field = Field()
         self.assertEqual(Model.meta.fields, {"field": Model.field})
 
+    def test_field_late_reset(self):
+        class Model(Table):
+            field = Field()
+            late: Field
+        Model(field=1)
+        Model.late = Field()
+        resolve_late_descriptors(Model)
+        inst = Model(field=1, late=2)
+        self.assertEqual(inst.late, 2)
+
+    def test_init_defaults(self):
+        class Model(Table):
+            required = Field()
+            server = Field(default=Default.SERVER)
+            value = Field(default="default")
+        with self.assertRaises(KeyError):
+            Model(server=1)
+        with self.assertRaises(KeyError):
+            Model(required=1)
+        inst = Model(required=1, server=2)
+        self.assertEqual(inst.value, "default")
+        inst = Model(required=1, server=2, value=None)
+        self.assertIsNone(inst.value)
+
+    def test_init_decode(self):
+        class Model(Table):
+            number = IntField()
+            flag = BoolField()
+        inst = Model(number="3", flag=1)
+        self.assertIs(inst.number, 3)
+        self.assertIs(inst.flag, True)
+        inst = Model(number=True, flag=False)
+        self.assertIs(inst.number, 1)
+        self.assertIs(inst.flag, False)
+
+    def test_from_row(self):
+        class Model(Table):
+            number = IntField()
+            flag = BoolField(default=False)
+        # Fields are ordered by name.
+        inst = Model.meta.from_row((1, "3", "ignored"))
+        self.assertIsInstance(inst, Model)
+        self.assertEqual(inst, Model(number=3, flag=True))
+        inst = Model.meta.from_row_at(1)(("ignored", 0, 4))
+        self.assertEqual(inst, Model(number=4, flag=False))
+
+    def test_query_cache_limit(self):
+        class Model(Table):
+            field = Field()
+        cache = Model.meta.query_cache
+        for key in range(QUERY_CACHE_SIZE + 1):
+            cache[key] = str(key)
+        self.assertEqual(len(cache), QUERY_CACHE_SIZE)
+        self.assertNotIn(0, cache)
+        self.assertEqual(cache[QUERY_CACHE_SIZE], str(QUERY_CACHE_SIZE))
+
+    def test_query_cache_reset(self):
+        class Other(Table):
+            key = Field()
+        class Model(Table):
+            other_key = Field(foreign=Other.key)
+            other = Reference(other_key, Other)
+        joins = Model.meta.join_refs(Model.other)
+        transform = _select_transform(Model, joins)
+        self.assertIs(_select_transform(Model, joins), transform)
+        self.assertIn(transform, Model.meta.query_cache.values())
+        resolve_late_descriptors(Model)
+        self.assertNotIn(transform, Model.meta.query_cache.values())
+        self.assertIsNot(_select_transform(Model, joins), transform)
+
     def test_field_subclass(self):
         class Base(Table):
             lower = Field()
@@ -56,6 +128,7 @@ class TestTable(TestCase):
             higher = Field()
         self.assertEqual(Base.meta.fields, {"lower": Base.lower})
         self.assertEqual(Sub.meta.fields, {"lower": Sub.lower, "higher": Sub.higher})
+        self.assertEqual([field.name for field in Sub.meta.field_list], ["higher", "lower"])
         self.assertEqual(Base.meta.fields["lower"].id, "Base.lower")
         self.assertEqual(Sub.meta.fields["lower"].id, "Sub.lower")
 
@@ -2,7 +2,7 @@
 Partial typing protocols for DB-API 2.0.
 """
 
-from typing import Any, Awaitable, Iterable, Optional, Tuple, TypeVar, Union
+from typing import Any, Awaitable, Iterable, Optional, Sequence, Tuple, TypeVar, Union
 
 from typing_extensions import Protocol
 
@@ -14,7 +14,10 @@ _MaybeAsync = Union[_T, Awaitable[_T]]
 class Cursor(Protocol):
     def close(self) -> None: ...
     def execute(self, operation: Any, parameters: Iterable[Any] = ...) -> Any: ...
+    def executemany(self, operation: Any, seq_of_parameters: Iterable[Iterable[Any]]) -> Any: ...
     def fetchone(self) -> Optional[Tuple[Any, ...]]: ...
+    def fetchmany(self, size: int = ...) -> Sequence[Tuple[Any, ...]]: ...
+    def fetchall(self) -> Sequence[Tuple[Any, ...]]: ...
     lastrowid: Optional[int]
 
 
@@ -26,7 +29,10 @@ class Connection(Protocol):
 class AsyncCursor(Protocol):
     def close(self) -> _MaybeAsync[None]: ...
     def execute(self, operation: Any, parameters: Iterable[Any] = ...) -> _MaybeAsync[Any]: ...
+    def executemany(self, operation: Any, seq_of_parameters: Iterable[Iterable[Any]]) -> _MaybeAsync[Any]: ...
     def fetchone(self) -> _MaybeAsync[Optional[Tuple[Any, ...]]]: ...
+    def fetchmany(self, size: int = ...) -> _MaybeAsync[Sequence[Tuple[Any, ...]]]: ...
+    def fetchall(self) -> _MaybeAsync[Sequence[Tuple[Any, ...]]]: ...
     lastrowid: Optional[int]
 
 
@@ -37,6 +37,21 @@ class Dialect:
     server_default: Optional[pypika.terms.Term] = pypika.terms.LiteralValue("DEFAULT")
     """Keyword used to indicate a value should use a column default."""
 
+    placeholder = "?"
+    """Marker for a parameter in a query, following the database driver's parameter style."""
+
+    quote_char = '"'
+    """Character used to quote table and column names, matching that of `query_builder`."""
+
+    multi_statement = False
+    """Whether the database driver accepts multiple `;`-separated statements in one execution."""
+
+    executemany = True
+    """Whether multi-row inserts should use the driver's `executemany` instead of one statement."""
+
+    returning = False
+    """Whether `INSERT` queries accept a `RETURNING` clause, used to fetch a new primary key."""
+
     @classmethod
     def column_type(cls, field: Field[Any]) -> str:
         """
@@ -110,6 +125,16 @@ class PostgreSQLDialect(Dialect):
 
     datetime_default_now = pypika.functions.Now()  # Host's timezone
 
+    placeholder = "%s"
+
+    multi_statement = True
+
+    # Conservative default: aiopg (via psycopg2) sends a separate statement per row, so a single
+    # multi-row `INSERT` is faster there, whereas psycopg 3 would manage either way.
+    executemany = False
+
+    returning = True  # Cursors have no usable `lastrowid`
+
 
 class MySQLDialect(Dialect):
     """
@@ -133,3 +158,7 @@ class MySQLDialect(Dialect):
             return super().column_type(field)
 
     datetime_default_now = pypika.functions.CurTimestamp()  # Host's timezone
+
+    placeholder = "%s"
+
+    quote_char = "`"
@@ -141,6 +141,12 @@ class Nullable:
         def __get__(self, obj: Optional[Table], objtype: Optional[Type[Table]] = None):
             return super().__get__(obj, objtype)
 
+        def _bind(self, obj: Table) -> "Nullable.BoundReference[_TTable]":
+            return Nullable.BoundReference(self, obj)
+
     class BoundReference(_Nullable, BoundReference[_TTable]):
 
         value: Optional[_TTable]
+
+        def _missing(self) -> None:
+            return None
@@ -6,7 +6,10 @@ from copy import copy
 from datetime import datetime
 from enum import Enum, auto
 import operator
-from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union, overload
+from typing import (
+    Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union,
+    overload,
+)
 
 import pypika
 import pypika.terms
@@ -20,6 +23,10 @@ _RefSpec = Union["Reference[Table]", "Tuple[Reference[Table], ...]"]
 _RefJoinSpec = Tuple[Tuple["Reference[Table]", ...], pypika.Table, pypika.Criterion]
 
 
+# Maximum number of rendered statements kept per table by `TableMeta.query_cache`.
+QUERY_CACHE_SIZE = 256
+
+
 def snake_case(value: str) -> str:
     """
     Convert a CamelCase name into snake_case.
@@ -43,6 +50,45 @@ class Default(Enum):
     """Use the current timestamp as provided by the database host."""
 
 
+def _now() -> datetime:
+    return datetime.now().astimezone()
+
+
+class _cached_property(Generic[_TAny]):
+    """
+    Read-only property whose value is computed once and then stored on the instance, until removed
+    by `TableMeta.reset`.
+    """
+
+    def __init__(self, fn: Callable[[Any], _TAny]):
+        self.fn = fn
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner: Type[Any], name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> _TAny:
+        if obj is None:
+            return self  # type: ignore
+        value = obj.__dict__[self.name] = self.fn(obj)
+        return value
+
+
+class _LimitedCache(Dict[Any, Any]):
+    """
+    Dictionary holding at most `size` items, discarding the oldest when adding beyond that.
+    """
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.size = size
+
+    def __setitem__(self, key: Any, value: Any):
+        if len(self) >= self.size and key not in self:
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
+
+
 class TableMeta(Generic[_TTable]):
     """
     Metadata and helper methods for a `Table` class, accessible via `Table.meta`.
@@ -53,6 +99,7 @@ class TableMeta(Generic[_TTable]):
         self.name = name or snake_case(table.__name__)
         self.pk_table = pypika.Table(self.name)
         self.primary = None
+        self.pk_primary: Optional[pypika.Field] = None
         for cls in table.__bases__:
             if cls is Table:
                 break
@@ -65,6 +112,18 @@ class TableMeta(Generic[_TTable]):
                     primary = cls.meta.primary.name
         if primary:
             self.primary = self.fields[primary]
+            self.pk_primary = self.pk_table.field(primary)
+
+    def reset(self) -> None:
+        """
+        Discard metadata derived from the table's fields, so that it's recomputed on next use.
+
+        Needed if fields are assigned to the table after it's been used (see
+        `tydb.utils.resolve_late_descriptors`, which calls this).
+        """
+        for name, value in vars(TableMeta).items():
+            if isinstance(value, _cached_property):
+                self.__dict__.pop(name, None)
 
     def _filter(self, cls: Type[_TAny]) -> Dict[str, _TAny]:
         matches: Dict[str, _TAny] = {}
@@ -77,20 +136,120 @@ class TableMeta(Generic[_TTable]):
                 matches[name] = value
         return matches
 
-    @property
+    @_cached_property
     def fields(self) -> Dict[str, "Field[Any]"]:
         """
         Mapping of attribute names to `Field` objects, for each declared field.
+
+        Collected on first use and then reused, so shouldn't be modified.
         """
         return self._filter(Field)
 
-    @property
+    @_cached_property
+    def field_list(self) -> Tuple["Field[Any]", ...]:
+        """
+        All `Field` objects of `fields`, in order.
+        """
+        return tuple(self.fields.values())
+
+    @_cached_property
     def references(self) -> Dict[str, "Reference[Table]"]:
         """
         Mapping of attribute names to `Reference` objects, for each declared reference.
+
+        Collected on first use and then reused, so shouldn't be modified.
         """
         return self._filter(Reference)
 
+    @staticmethod
+    def _decode_source(pos: int, name: str, field: "Field[Any]", value: str, env: Dict[str, Any]) -> List[str]:
+        env["_decode_{}".format(pos)] = field.decode
+        if type(field).decode is Field.decode and field.data_type in (int, float, bool):
+            # Plain numeric fields only cast their value, so skip the call if the value is already
+            # of the right type (as it usually is when coming from the database).
+            env["_type_{}".format(pos)] = field.data_type
+            return [
+                "    value = {}".format(value),
+                "    attrs[{0!r}] = value if value.__class__ is _type_{1} else _decode_{1}(value)".format(name, pos),
+            ]
+        else:
+            return ["    attrs[{!r}] = _decode_{}({})".format(name, pos, value)]
+
+    @_cached_property
+    def init(self) -> Callable[["Table", Dict[str, Any]], None]:
+        """
+        Generated function to populate a new instance from a mapping of field names to values,
+        decoding each value and filling in defaults for missing fields.
+
+        The source is specialised to the table's fields, so that constructing an instance doesn't
+        need to walk the field list or check defaults each time.
+        """
+        env: Dict[str, Any] = {"_now": _now}
+        lines = ["def init(self, data):", "    attrs = self.__dict__"]
+        for pos, (name, field) in enumerate(self.fields.items()):
+            if field.default in (Default.NONE, Default.SERVER):
+                value = "data[{!r}]".format(name)
+            elif field.default is Default.TIMESTAMP_NOW:
+                value = "data[{0!r}] if {0!r} in data else _now()".format(name)
+            else:
+                env["_default_{}".format(pos)] = field.default
+                value = "data.get({!r}, _default_{})".format(name, pos)
+            lines.extend(self._decode_source(pos, name, field, value, env))
+        exec("\n".join(lines), env)
+        return env["init"]
+
+    @_cached_property
+    def from_row(self) -> Callable[[Sequence[Any]], _TTable]:
+        """
+        Generated function to create an instance from a sequence of values in field order, such
+        as a row of a query result, decoding each value.
+
+        All fields must be present (any values past the last field are ignored), and the table's
+        `__init__` is bypassed.
+        """
+        return self.from_row_at(0)
+
+    @_cached_property
+    def _row_readers(self) -> Dict[int, Callable[[Sequence[Any]], _TTable]]:
+        return {}
+
+    def from_row_at(self, offset: int) -> Callable[[Sequence[Any]], _TTable]:
+        """
+        Like `from_row`, but with the table's fields starting at the given position in the row, so
+        that a row containing multiple tables' fields can be read without slicing it.
+        """
+        try:
+            return self._row_readers[offset]
+        except KeyError:
+            pass
+        env: Dict[str, Any] = {"_table": self.table, "_new": self.table.__new__}
+        lines = ["def from_row(row):", "    self = _new(_table)", "    attrs = self.__dict__"]
+        for pos, (name, field) in enumerate(self.fields.items()):
+            lines.extend(self._decode_source(pos, name, field, "row[{}]".format(offset + pos), env))
+        lines.append("    return self")
+        exec("\n".join(lines), env)
+        self._row_readers[offset] = from_row = env["from_row"]
+        return from_row
+
+    @_cached_property
+    def auto_joins(self) -> Tuple[Tuple["Reference[Table]", ...], ...]:
+        """
+        All `Reference` paths reachable from the table, as produced by `walk_refs`, for use when
+        automatically joining related tables.
+        """
+        return tuple(self.walk_refs())
+
+    @_cached_property
+    def query_cache(self) -> Dict[Any, Any]:
+        """
+        Storage for statements involving the table that have been rendered by queries (see
+        `tydb.queries`), along with generated row transforms, so that they can be reused by later
+        queries of the same shape.
+
+        Limited to `QUERY_CACHE_SIZE` statements, as shapes vary with e.g. the length of `IN` lists.
+        """
+        return _LimitedCache(QUERY_CACHE_SIZE)
+
     def walk_refs(self, *seen: Type["Table"]) -> List[Tuple["Reference[Table]", ...]]:
         """
         Recursively follow `Reference` declarations on a `Table`, avoiding any cycles.
@@ -168,17 +327,7 @@ class Table:
         cls.meta = TableMeta(cls, name, primary)
 
     def __init__(self, **data: Any):
-        for name, field in self.meta.fields.items():
-            try:
-                value = data[name]
-            except KeyError:
-                if field.default in (Default.NONE, Default.SERVER):
-                    raise
-                elif field.default is Default.TIMESTAMP_NOW:
-                    value = datetime.now().astimezone()
-                else:
-                    value = field.default
-            self.__dict__[name] = field.decode(value)
+        self.meta.init(self, data)
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -373,6 +522,55 @@ class Expr(_Term):
         args = (self._encode(arg) for arg in self.args)
         return self.op(*args)
 
+    def shape(self, params: List[Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Describe the structure of the expression, excluding its values, which are instead appended
+        to `params` in the order they appear in `pk_template`.
+
+        Expressions with the same shape produce the same template, so the shape can be used to
+        reuse a rendered statement.  Returns `None` if the expression contains pypika terms or
+        other non-value arguments, which can't be described this way.
+        """
+        parts: List[Any] = [self.op]
+        for arg in self.args:
+            if isinstance(arg, Expr):
+                shape = arg.shape(params)
+                if shape is None:
+                    return None
+                parts.append(shape)
+            elif isinstance(arg, Field):
+                # Fields compare to produce expressions, so mustn't appear in the shape directly.
+                parts.append((arg.owner, arg.name))
+            elif isinstance(arg, tuple):
+                if any(isinstance(item, (_Term, pypika.terms.Term, tuple)) for item in arg):
+                    return None
+                params.extend(arg)
+                parts.append(len(arg))
+            elif isinstance(arg, (_Term, pypika.terms.Term)) or (
+                isinstance(arg, Iterable) and not isinstance(arg, str)
+            ):
+                return None
+            else:
+                params.append(arg)
+                parts.append(None)
+        return tuple(parts)
+
+    def pk_template(self, param: pypika.terms.Parameter):
+        """
+        Like `pk_frag`, but with each value replaced by the given parameter placeholder.
+        """
+        args: List[Any] = []
+        for arg in self.args:
+            if isinstance(arg, Expr):
+                args.append(arg.pk_template(param))
+            elif isinstance(arg, Field):
+                args.append(arg.pk_field)
+            elif isinstance(arg, tuple):
+                args.append(tuple(param for _ in arg))
+            else:
+                args.append(param)
+        return self.op(*args)
+
     def __and__(self, other: Any):
         """
         Make a `this AND other` clause.
@@ -429,10 +627,13 @@ class Reference(_Descriptor[Table], Generic[_TTable], _Term):
     def __get__(self, obj: Optional[Table], objtype: Optional[Type[Table]] = None):
         if not obj:
             return self
-        bind = BoundReference(self, obj)
+        bind = self._bind(obj)
         setattr(obj, self.name, bind)
         return bind
 
+    def _bind(self, obj: Table) -> "BoundReference[_TTable]":
+        return BoundReference(self, obj)
+
     def __repr__(self):
         return "<{}: {} ({})>".format(self.__class__.__name__, self.id, self.table.__name__)
 
@@ -448,10 +649,35 @@ class BoundReference(Generic[_TTable]):
         self.ref = ref
         self.inst = inst
 
+    @property
+    def fetched(self) -> bool:
+        """
+        Whether the related object is available as `value`, without needing to query for it.
+        """
+        attrs = self.__dict__
+        return "value" in attrs or "_load" in attrs
+
+    def __getattr__(self, name: str) -> Any:
+        # Instances from a joined query are only constructed when first accessed, using a loader
+        # and the result row stashed here by the query.
+        if name == "value":
+            try:
+                load, row = self.__dict__.pop("_load")
+            except KeyError:
+                pass
+            else:
+                value = self.value = load(row)
+                return value
+        raise AttributeError(name)
+
+    def _missing(self) -> Optional[_TTable]:
+        # Result of loading when no related object was found -- overridden for nullable references.
+        raise LookupError("Expected one record but none found")
+
     def __repr__(self):
         return "<{}: {} ({}) on {!r}{}>".format(
             self.__class__.__name__, self.ref.id, self.ref.table.__name__, self.inst,
-            ": {!r}".format(self.value) if hasattr(self, "value") else ", not fetched",
+            ": {!r}".format(self.value) if self.fetched else ", not fetched",
         )
 
 
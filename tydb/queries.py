@@ -1,12 +1,17 @@
+import asyncio
+from collections import deque
 import logging
+from operator import attrgetter
 from typing import (
-    Any, Awaitable, AsyncIterator, Callable, Generic, Iterable, Iterator, List, Optional, Tuple,
-    Type, TypeVar, Union, overload,
+    Any, Awaitable, AsyncIterator, Callable, Deque, Dict, Generic, Iterable, Iterator, List,
+    Optional, Sequence, Tuple, Type, TypeVar, Union, overload,
 )
 
 import pypika
+import pypika.terms
 from pypika.queries import CreateQueryBuilder, QueryBuilder
-from typing_extensions import Literal, Self
+from pypika.utils import format_quotes
+from typing_extensions import Self
 
 from .api import AsyncCursor, Cursor
 from .dialects import Dialect
@@ -18,31 +23,18 @@ from .utils import maybe_await
 _TAny = TypeVar("_TAny")
 _TAnyAlt = TypeVar("_TAnyAlt")
 _TTable = TypeVar("_TTable", bound=Table)
-_TTableAlt = TypeVar("_TTableAlt", bound=Table)
 
 
 LOG = logging.getLogger(__name__)
 
 
-class _AsyncIterProxy(Iterator[_TAny], AsyncIterator[_TAny]):
+DEFAULT_PREFETCH = 128
+"""Number of rows requested from the cursor at a time when iterating over results."""
 
-    def __init__(self, iterator: Iterable[_TAny]):
-        self.iter = iter(iterator)
 
-    def __iter__(self):
-        return self
-
-    def __aiter__(self):
-        return self
-
-    def __next__(self):
-        return next(self.iter)
-
-    async def __anext__(self):
-        try:
-            return next(self.iter)
-        except StopIteration:
-            raise StopAsyncIteration
+async def _aiter_buffer(buffer: Iterable[_TAny]) -> AsyncIterator[_TAny]:
+    for item in buffer:
+        yield item
 
 
 class _CommonQueryResult(Generic[_TAny]):
@@ -51,6 +43,9 @@ class _CommonQueryResult(Generic[_TAny]):
         self.buffer: List[_TAny] = []
         self.iterating = False
         self.done = False
+        # Fetch handler for the current state, swapped out as iteration starts and finishes so
+        # that each step doesn't need to check the state flags.
+        self._step = self._step_start
 
     def _iter(self, iterator: Callable[[List[_TAny]], _TAnyAlt]) -> Union[Self, _TAnyAlt]:
         if self.iterating:
@@ -60,19 +55,38 @@ class _CommonQueryResult(Generic[_TAny]):
         else:
             return self
 
-    def _next_before(self):
-        if not self.iterating:
-            self.iterating = True
+    def _step_start(self) -> Any:
+        self.iterating = True
+        self._step = self._step_fetch
+        return self._step_fetch()
 
-    def _next_after(self, row: Optional[Tuple[Any, ...]]) -> _TAny:
-        if row:
-            item = self._transform(row)
-            self.buffer.append(item)
-            return item
-        else:
-            self.iterating = False
-            self.done = True
-            raise StopIteration
+    def _step_fetch(self) -> Any:
+        raise NotImplementedError
+
+    def _step_done(self) -> Any:
+        raise NotImplementedError
+
+    def _next_after(self, row: Tuple[Any, ...]) -> _TAny:
+        item = self._transform(row)
+        self.buffer.append(item)
+        return item
+
+    def _check_fetch_all(self) -> None:
+        if self.iterating:
+            raise RuntimeError("Initial result iteration still in progress")
+
+    def _finish_all(self, rows: Iterable[Tuple[Any, ...]]) -> List[_TAny]:
+        transform = self._transform
+        self.buffer.extend([transform(row) for row in rows])
+        self._finish()
+        return list(self.buffer)
+
+    def _finish(self) -> None:
+        # Callers raise the appropriate stop exception, so that the async path doesn't need to
+        # catch and convert one.
+        self.iterating = False
+        self.done = True
+        self._step = self._step_done
 
     def __repr__(self) -> str:
         if self.done:
@@ -89,44 +103,127 @@ class _CommonQueryResult(Generic[_TAny]):
 
 class _QueryResult(_CommonQueryResult[_TAny]):
 
-    def __init__(self, cursor: Cursor):
+    def __init__(self, cursor: Cursor, prefetch: int = DEFAULT_PREFETCH):
         super().__init__()
         self.cursor = cursor
+        self.prefetch = prefetch
+        self._fetchmany = cursor.fetchmany
+        self._rows: Deque[Tuple[Any, ...]] = deque()
 
     def __iter__(self) -> Iterator[_TAny]:
         return self._iter(iter)
 
     def __next__(self) -> _TAny:
-        self._next_before()
-        row = self.cursor.fetchone()
-        return self._next_after(row)
+        return self._step()
+
+    def _step_fetch(self) -> _TAny:
+        rows = self._rows
+        if not rows:
+            rows.extend(self._fetchmany(self.prefetch))
+        if rows:
+            return self._next_after(rows.popleft())
+        self._finish()
+        raise StopIteration
+
+    def _step_done(self) -> _TAny:
+        raise StopIteration
+
+    def fetch_all(self) -> List[_TAny]:
+        """
+        Fetch all remaining rows from the cursor in one go, and return the complete results.
+
+        Cheaper than iterating for results that will be consumed in full anyway.
+        """
+        self._check_fetch_all()
+        if self.done:
+            return list(self.buffer)
+        rows = self._rows
+        rows.extend(self.cursor.fetchall())
+        self._rows = deque()
+        return self._finish_all(rows)
 
     def __aiter__(self) -> AsyncIterator[_TAny]:
-        return self._iter(_AsyncIterProxy)
+        return self._iter(_aiter_buffer)
 
     async def __anext__(self) -> _TAny:
         try:
-            return self.__next__()
+            return self._step()
         except StopIteration:
             raise StopAsyncIteration
 
 
 class _AsyncQueryResult(_CommonQueryResult[_TAny]):
 
-    def __init__(self, cursor: AsyncCursor):
+    def __init__(self, cursor: AsyncCursor, prefetch: int = DEFAULT_PREFETCH, pipeline: bool = False):
         super().__init__()
         self.cursor = cursor
+        self.prefetch = prefetch
+        self.pipeline = pipeline
+        self._fetchmany = cursor.fetchmany
+        self._rows: Deque[Tuple[Any, ...]] = deque()
+        self._pending: Optional["asyncio.Future[Sequence[Tuple[Any, ...]]]"] = None
 
     def __aiter__(self) -> AsyncIterator[_TAny]:
-        return self._iter(_AsyncIterProxy)
+        return self._iter(_aiter_buffer)
 
-    async def __anext__(self) -> _TAny:
-        self._next_before()
-        row = await maybe_await(self.cursor.fetchone())
-        try:
-            return self._next_after(row)
-        except StopIteration:
-            raise StopAsyncIteration
+    def __anext__(self) -> Awaitable[_TAny]:
+        return self._step()
+
+    async def _step_fetch(self) -> _TAny:
+        rows = self._rows
+        if not rows:
+            rows.extend(await self._fetch())
+        if rows:
+            return self._next_after(rows.popleft())
+        self._finish()
+        raise StopAsyncIteration
+
+    async def _step_done(self) -> _TAny:
+        raise StopAsyncIteration
+
+    async def fetch_all(self) -> List[_TAny]:
+        """
+        Like `SelectQueryResult.fetch_all`, but for asynchronous cursors.
+        """
+        self._check_fetch_all()
+        if self.done:
+            return list(self.buffer)
+        rows = self._rows
+        rows.extend(await maybe_await(self.cursor.fetchall()))
+        self._rows = deque()
+        return self._finish_all(rows)
+
+    async def aclose(self) -> None:
+        """
+        Stop fetching results, for when iteration is abandoned part way (e.g. breaking out of a
+        loop), discarding any batch being fetched ahead when pipelining and closing the cursor.
+
+        Later iterations only see the results fetched before closing.
+        """
+        pending = self._pending
+        if pending:
+            self._pending = None
+            # Let the fetch finish rather than cancelling it, as the driver may not be able to stop
+            # it part way, so that it isn't still running on the connection -- any error is
+            # retrieved so that it isn't reported as unhandled.
+            await asyncio.gather(pending, return_exceptions=True)
+        if not self.done:
+            self._rows.clear()
+            await maybe_await(self.cursor.close())
+            self._finish()
+
+    async def _fetch(self) -> Sequence[Tuple[Any, ...]]:
+        pending = self._pending
+        if pending:
+            self._pending = None
+            rows = await pending
+        else:
+            rows = await maybe_await(self._fetchmany(self.prefetch))
+        if self.pipeline and len(rows) >= self.prefetch:
+            # A full batch suggests there are more rows to come, so start fetching the next batch
+            # whilst this one is being consumed.
+            self._pending = asyncio.ensure_future(maybe_await(self._fetchmany(self.prefetch)))
+        return rows
 
 
 class _RawQueryResult(_CommonQueryResult[Tuple[Any, ...]]):
@@ -162,55 +259,94 @@ class _SelectQueryResult(_CommonQueryResult[_TTable]):
         _CommonQueryResult.__init__(self)
         self.table = table
         self.joins = joins
+        self._transform = _select_transform(table, joins)
 
-    @overload
-    def _unpack(
-        self, table: Type[_TTableAlt], result: Any, offset: Literal[0] = 0,
-    ) -> Tuple[_TTableAlt, int]: ...
-    @overload
-    def _unpack(
-        self, table: Type[_TTableAlt], result: Any, offset: int,
-    ) -> Tuple[Optional[_TTableAlt], int]: ...
-
-    def _unpack(
-        self, table: Type[_TTableAlt], result: Tuple[Any, ...], offset: int = 0,
-    ) -> Tuple[Optional[_TTableAlt], int]:
-        fields = table.meta.fields
-        size = len(fields)
-        row = result[offset : offset + size]
-        if offset and all(value is None for value in row):
-            return (None, size)
-        data = dict(zip(fields, row))
-        return (table(**data), size)
-
-    def _transform(self, row: Tuple[Any, ...]) -> _TTable:
-        final, pos = self._unpack(self.table, row)
-        for path, _, _ in self.joins:
-            table = path[-1].table
-            instance, offset = self._unpack(table, row, pos)
-            pos += offset
-            target = final
-            for ref in path[:-1]:
-                target = getattr(target, ref.field.name)
-                if target is None:
-                    break
-            if target is not None:
-                bind = getattr(target, path[-1].name)
-                bind.value = instance
-        return final
+
+def _spec_key(spec: _RefSpec) -> Tuple[Tuple[Type[Table], str], ...]:
+    # References compare to produce expressions, so can't be used in cache keys directly.
+    if not isinstance(spec, tuple):
+        spec = (spec,)
+    return tuple((ref.owner, ref.name) for ref in spec)
+
+
+def _select_transform(table: Type[_TTable], joins: List[_RefJoinSpec]) -> Callable[[Sequence[Any]], _TTable]:
+    """
+    Generate (or reuse) a function to construct a table instance from a result row, with any
+    joined instances attached to their references.
+
+    The row layout is fixed for a given table and set of joins, so column offsets and the chain of
+    instances are worked out ahead of time and written into the function source.  Joined instances
+    are constructed lazily, when the reference's value is first accessed.
+    """
+    if not joins:
+        # Without any joins, the row holds exactly the table's fields.
+        return table.meta.from_row
+    # Each joined table's fields are read straight from their position in the row.
+    from_rows = [table.meta.from_row]
+    pos = len(table.meta.fields)
+    for path, _, _ in joins:
+        meta = path[-1].table.meta
+        from_rows.append(meta.from_row_at(pos))
+        pos += len(meta.fields)
+    # Instance constructors are regenerated if a joined table's fields change, so they form part of
+    # the key, which stops a stale function being reused.
+    key = (_select_transform, tuple(from_rows), tuple(_spec_key(path) for path, _, _ in joins))
+    cache = table.meta.query_cache
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    env = {"_from_row_{}".format(num): from_row for num, from_row in enumerate(from_rows)}
+    # One function for the root table, and a loader for each joined table, each of which attaches
+    # the loaders of the tables joined onto it.
+    funcs: Dict[Tuple[Any, ...], List[str]] = {
+        (): ["def transform(row):", "    inst = _from_row_0(row)"],
+    }
+    pos = len(table.meta.fields)
+    for num, (path, _, _) in enumerate(joins, 1):
+        ref = path[-1]
+        fields = list(ref.table.meta.fields)
+        # A primary key can't be null, so a null in its column means the join didn't match,
+        # otherwise all of the table's columns need to be null.
+        primary = ref.table.meta.primary
+        if primary:
+            missing = "row[{}] is None".format(pos + fields.index(primary.name))
+        else:
+            missing = " and ".join("row[{}] is None".format(pos + i) for i in range(len(fields)))
+        funcs[path] = [
+            "def _load_{}(row):".format(num),
+            "    if {}:".format(missing),
+            "        return None",
+            "    inst = _from_row_{}(row)".format(num),
+        ]
+        funcs[path[:-1]].append("    inst.{}._load = (_load_{}, row)".format(ref.name, num))
+        pos += len(fields)
+    lines: List[str] = []
+    for func in funcs.values():
+        lines.extend(func)
+        lines.append("    return inst")
+    exec("\n".join(lines), env)
+    cache[key] = transform = env["transform"]
+    return transform
 
 
 class SelectQueryResult(_SelectQueryResult[_TTable], _QueryResult[_TTable]):
 
-    def __init__(self, cursor: Cursor, table: Type[_TTable], joins: List[_RefJoinSpec]):
-        _QueryResult.__init__(self, cursor)
+    def __init__(
+        self, cursor: Cursor, table: Type[_TTable], joins: List[_RefJoinSpec],
+        prefetch: int = DEFAULT_PREFETCH,
+    ):
+        _QueryResult.__init__(self, cursor, prefetch)
         _SelectQueryResult.__init__(self, table, joins)
 
 
 class AsyncSelectQueryResult(_SelectQueryResult[_TTable], _AsyncQueryResult[_TTable]):
 
-    def __init__(self, cursor: AsyncCursor, table: Type[_TTable], joins: List[_RefJoinSpec]):
-        _AsyncQueryResult.__init__(self, cursor)
+    def __init__(
+        self, cursor: AsyncCursor, table: Type[_TTable], joins: List[_RefJoinSpec],
+        prefetch: int = DEFAULT_PREFETCH, pipeline: bool = False,
+    ):
+        _AsyncQueryResult.__init__(self, cursor, prefetch, pipeline)
         _SelectQueryResult.__init__(self, table, joins)
 
 
@@ -221,6 +357,18 @@ class _Query(Generic[_TTable]):
     def __init__(self, dialect: Type[Dialect], table: Type[_TTable]):
         self.dialect = dialect
         self.table = table
+        self.params: Sequence[Any] = ()
+        self.many = False
+        self._sql: Optional[str] = None
+
+    @property
+    def sql(self) -> str:
+        """
+        SQL statement for the query, rendered from `pk_query` on first use.
+        """
+        if self._sql is None:
+            self._sql = str(self.pk_query)
+        return self._sql
 
     @overload
     def execute(self, cursor: Cursor) -> None: ...
@@ -230,12 +378,25 @@ class _Query(Generic[_TTable]):
     def execute(self, cursor: Union[Cursor, AsyncCursor]):
         """
         Perform the query against the database associated with the provided cursor.
+
+        If `many` is set, `params` holds a set of parameters for each execution of the statement.
         """
-        LOG.debug(self.pk_query)
+        sql = self.sql
+        params = self.params
+        if LOG.isEnabledFor(logging.DEBUG):
+            if params:
+                LOG.debug("%s -- %r", sql, params)
+            else:
+                LOG.debug("%s", sql)
         try:
-            return cursor.execute(str(self.pk_query))
+            if self.many:
+                return cursor.executemany(sql, params)
+            elif params:
+                return cursor.execute(sql, params)
+            else:
+                return cursor.execute(sql)
         except Exception as ex:
-            raise RuntimeError("Failed to execute query\n{}".format(self.pk_query)) from ex
+            raise RuntimeError("Failed to execute query\n{}".format(sql)) from ex
 
 
 class _AsyncQuery(_Query[_TTable]):
@@ -244,7 +405,19 @@ class _AsyncQuery(_Query[_TTable]):
         try:
             return await maybe_await(super().execute(cursor))
         except Exception as ex:
-            raise RuntimeError("Failed to execute query\n{}".format(self.pk_query)) from ex
+            raise RuntimeError("Failed to execute query\n{}".format(self.sql)) from ex
+
+
+class BatchQuery(_Query[Table]):
+    """
+    Combination of several queries without parameters (e.g. table creation), executed as a single
+    statement for dialects that support it (see `Dialect.multi_statement`).
+    """
+
+    def __init__(self, dialect: Type[Dialect], *queries: _Query[Any]):
+        super().__init__(dialect, Table)
+        self.queries = queries
+        self._sql = ";\n".join(query.sql for query in queries)
 
 
 class CreateTableQuery(_Query[Table]):
@@ -311,10 +484,30 @@ class _SelectQuery(_Query[_TTable]):
     ):
         super().__init__(dialect, table)
         self.where = where
-        self.joins = table.meta.join_refs(*refs)
-        self.pk_query = self._pk_query(offset, limit)
-
-    def _pk_query(self, offset: Optional[int] = None, limit: Optional[int] = None):
+        params: List[Any] = []
+        shape = where.shape(params) if where else ()
+        if shape is None:
+            # Expressions containing pypika terms can't be parameterised, so render them in full.
+            self.joins = table.meta.join_refs(*refs)
+            self.pk_query = self._pk_query(offset, limit)
+            return
+        # Parameters follow the order of the rendered statement.
+        if limit:
+            params.append(limit)
+        if offset:
+            params.append(offset)
+        self.params = params
+        key = (_SelectQuery, dialect, tuple(map(_spec_key, refs)), shape, bool(offset), bool(limit))
+        cache = table.meta.query_cache
+        try:
+            self._sql, self.joins = cache[key]
+        except KeyError:
+            self.joins = table.meta.join_refs(*refs)
+            param = pypika.terms.Parameter(dialect.placeholder)
+            self._sql = str(self._pk_query(param if offset else None, param if limit else None, param))
+            cache[key] = (self._sql, self.joins)
+
+    def _pk_query(self, offset: Any = None, limit: Any = None, param: Optional[pypika.terms.Parameter] = None):
         query: QueryBuilder = (
             self.dialect.query_builder
             .from_(self.table.meta.pk_table)
@@ -326,79 +519,177 @@ class _SelectQuery(_Query[_TTable]):
             cols = (pk_foreign[field] for field in ref.table.meta.fields)
             query = query.select(*cols)
         if self.where:
-            query = query.where(self.where.pk_frag)
+            query = query.where(self.where.pk_template(param) if param else self.where.pk_frag)
         if offset:
             query = query.offset(offset)
         if limit:
             query = query.limit(limit)
         return query
 
-    def _unpack(self, table: Type[_TTableAlt], result: Tuple[Any, ...]) -> Tuple[_TTableAlt, int]:
-        fields = table.meta.fields
-        size = len(fields)
-        row = result[:size]
-        data = dict(zip(fields, row))
-        return (table(**data), size)
-
-    def execute(self, cursor: Union[Cursor, AsyncCursor]):
+    def execute(self, cursor: Union[Cursor, AsyncCursor], prefetch: int = DEFAULT_PREFETCH):
         """
         Like `Query.execute`, but yields the results as instances of the table's class.
+
+        Rows are fetched from the cursor in batches of up to `prefetch` rows.
         """
         return super().execute(cursor)
 
 
 class SelectQuery(_SelectQuery[_TTable]):
 
-    def execute(self, cursor: Cursor) -> SelectQueryResult[_TTable]:
+    def execute(self, cursor: Cursor, prefetch: int = DEFAULT_PREFETCH) -> SelectQueryResult[_TTable]:
         super().execute(cursor)
-        return SelectQueryResult(cursor, self.table, self.joins)
+        return SelectQueryResult(cursor, self.table, self.joins, prefetch)
+
+    def execute_limited(self, cursor: Cursor) -> List[_TTable]:
+        """
+        Like `execute`, but fetches all rows at once and returns the table instances directly,
+        skipping the result object.  Intended for queries with a small `limit`.
+        """
+        super().execute(cursor)
+        transform = _select_transform(self.table, self.joins)
+        return [transform(row) for row in cursor.fetchall()]
 
 
 class AsyncSelectQuery(_AsyncQuery[_TTable], _SelectQuery[_TTable]):
 
-    async def execute(self, cursor: AsyncCursor) -> AsyncSelectQueryResult[_TTable]:
+    async def execute(
+        self, cursor: AsyncCursor, prefetch: int = DEFAULT_PREFETCH, pipeline: bool = False,
+    ) -> AsyncSelectQueryResult[_TTable]:
+        """
+        Like `SelectQuery.execute`, but for asynchronous cursors.
+
+        With `pipeline` set, each batch of rows is requested as soon as the previous one arrives,
+        so that the database round trip overlaps with processing the current batch.  This leaves a
+        fetch in progress on the connection during iteration, so should only be used if nothing
+        else will use the connection until the results have been fully iterated over.
+        """
+        await super().execute(cursor)
+        return AsyncSelectQueryResult(cursor, self.table, self.joins, prefetch, pipeline)
+
+    async def execute_limited(self, cursor: AsyncCursor) -> List[_TTable]:
+        """
+        Like `SelectQuery.execute_limited`, but for asynchronous cursors.
+        """
         await super().execute(cursor)
-        return AsyncSelectQueryResult(cursor, self.table, self.joins)
+        transform = _select_transform(self.table, self.joins)
+        return [transform(row) for row in await maybe_await(cursor.fetchall())]
 
 
 class _InsertQuery(_Query[_TTable]):
     """
     Representation of an `INSERT` SQL query.
+
+    Values can be given either as `rows`, each with a value per field, or as `columns`, each with a
+    value per row for the corresponding field.
     """
 
     def __init__(
         self, dialect: Type[Dialect], table: Type[_TTable], *rows: Iterable[Any],
-        fields: Iterable["Field[Any]"],
+        fields: Sequence["Field[Any]"], columns: Optional[Sequence[Sequence[Any]]] = None,
     ):
         super().__init__(dialect, table)
+        if columns is not None:
+            if rows:
+                raise TypeError("Can't insert both rows and columns")
+            self.columns = columns
+        else:
+            self.columns = list(zip(*rows))
         self.rows = rows
         self.fields = fields
-        self.pk_query = self._pk_query()
+        # A single row's new primary key can be returned by the query itself, where supported.
+        count = len(self.columns[0]) if self.columns else len(rows)
+        self.returning = bool(dialect.returning and count == 1 and table.meta.primary)
+        if fields:
+            self._sql, self.params = self._template()
+        else:
+            self.pk_query = self._pk_query()
 
     def _pk_query(self):
-        cols = (field.name for field in self.fields)
-        rows = [
-            tuple(field.encode(value) for field, value in zip(self.fields, row))
-            for row in self.rows
-        ]
-        return (
+        # Only used for rows of all default values, which some dialects need special syntax for.
+        query = (
             self.dialect.query_builder
             .into(self.table.meta.pk_table)
-            .columns(*cols)
-            .insert(*rows)
+            .columns()
+            .insert(*(() for _ in self.rows))
         )
+        if self.returning:
+            query = query.returning(self.table.meta.pk_primary)
+        return query
+
+    def _template(self) -> Tuple[str, List[Any]]:
+        # The statement is simple enough to write out directly, with the values passed separately
+        # as parameters, rather than having pypika build and render every value of every row.
+        quote = self.dialect.quote_char
+        placeholder = self.dialect.placeholder
+        # Encode column by column, so each field's encoder is looked up once for all rows.
+        encoded = (map(field.encode, column) for field, column in zip(self.fields, self.columns))
+        rows = list(zip(*encoded))
+        if not any(isinstance(value, pypika.terms.Node) for row in rows for value in row):
+            if len(rows) == 1:
+                return self._plain_sql(), list(rows[0])
+            elif self.dialect.executemany:
+                self.many = True
+                return self._plain_sql(), rows
+        plain = self._row_sql()
+        values: List[str] = []
+        params: List[Any] = []
+        for row in rows:
+            if any(isinstance(value, pypika.terms.Node) for value in row):
+                # Keywords like DEFAULT can't be passed as parameters, so need to be written inline.
+                parts: List[str] = []
+                for value in row:
+                    if isinstance(value, pypika.terms.Node):
+                        parts.append(value.get_sql(quote_char=quote))
+                    else:
+                        parts.append(placeholder)
+                        params.append(value)
+                values.append("({})".format(", ".join(parts)))
+            else:
+                values.append(plain)
+                params.extend(row)
+        return self._render(values), params
+
+    def _plain_sql(self) -> str:
+        # Single rows of plain values (as from `Session.create`) only vary by their columns, so the
+        # statement can be reused, including for each row of an `executemany`.
+        key = (_InsertQuery, self.dialect, tuple(field.name for field in self.fields), self.returning)
+        cache = self.table.meta.query_cache
+        try:
+            return cache[key]
+        except KeyError:
+            sql = cache[key] = self._render([self._row_sql()])
+            return sql
+
+    def _row_sql(self) -> str:
+        return "({})".format(", ".join([self.dialect.placeholder] * len(self.fields)))
+
+    def _render(self, values: List[str]) -> str:
+        quote = self.dialect.quote_char
+        cols = ", ".join(format_quotes(field.name, quote) for field in self.fields)
+        sql = "INSERT INTO {} ({}) VALUES {}".format(
+            format_quotes(self.table.meta.name, quote), cols, ", ".join(values),
+        )
+        if self.returning:
+            assert self.table.meta.primary
+            sql += " RETURNING {}".format(format_quotes(self.table.meta.primary.name, quote))
+        return sql
 
     def _get_row(self, cursor: Union[Cursor, AsyncCursor]) -> Optional[int]:
         last = getattr(cursor, "lastrowid", None)
         return last if last not in (None, -1) else None
 
+    def _get_returned(self, row: Optional[Tuple[Any, ...]]) -> Optional[int]:
+        return row[0] if row else None
+
     def execute(self, cursor: Union[Cursor, AsyncCursor]):
         """
         Run `Query.execute` to completion, and return the new primary key value if present.
 
-        As `INSERT` queries do not return any rows, this method instead looks for the last row ID on
-        the cursor, which may or may not be present, and in any case will only be available when
-        inserting a single row with an integer primary key field.
+        For dialects supporting `RETURNING`, a single row's primary key is fetched as the result of
+        the query.  Otherwise, as `INSERT` queries do not return any rows, this method instead looks
+        for the last row ID on the cursor, which may or may not be present, and in any case will
+        only be available when inserting a single row with an integer primary key field.
         """
         return super().execute(cursor)
 
@@ -407,6 +698,8 @@ class InsertQuery(_InsertQuery[_TTable]):
 
     def execute(self, cursor: Cursor):
         super().execute(cursor)
+        if self.returning:
+            return self._get_returned(cursor.fetchone())
         return self._get_row(cursor)
 
 
@@ -414,6 +707,8 @@ class AsyncInsertQuery(_AsyncQuery[_TTable], _InsertQuery[_TTable]):
 
     async def execute(self, cursor: AsyncCursor):
         await super().execute(cursor)
+        if self.returning:
+            return self._get_returned(await maybe_await(cursor.fetchone()))
         return self._get_row(cursor)
 
 
@@ -426,40 +721,84 @@ class DeleteQuery(_Query[_TTable]):
         if not table.meta.primary:
             raise RuntimeError("Table {} has no primary key".format(table.meta.name))
         super().__init__(dialect, table)
-        self.pk_query = self._pk_query(*insts)
+        self.params = self._ids(*insts)
+        # The statement only depends on the number of IDs, so can be reused.
+        key = (DeleteQuery, dialect, len(self.params))
+        cache = table.meta.query_cache
+        try:
+            self._sql = cache[key]
+        except KeyError:
+            self._sql = cache[key] = str(self._pk_query(len(self.params)))
 
-    def _pk_query(self, *insts: _TTable):
+    def _ids(self, *insts: _TTable) -> List[Any]:
         pk_field = self.table.meta.primary
         if not pk_field:
             raise TypeError("Table {} has no primary key".format(self.table.__name__))
-        ids = []
-        for inst in insts:
-            value = getattr(inst, pk_field.name) if isinstance(inst, self.table) else inst
-            ids.append(value)
+        table = self.table
+        name = pk_field.name
+        encode = pk_field.encode
+        if insts and isinstance(insts[0], table):
+            # Typically called with either all instances or all IDs, so try the former in one pass.
+            try:
+                return list(map(encode, map(attrgetter(name), insts)))
+            except AttributeError:
+                pass
+        return [encode(getattr(inst, name) if isinstance(inst, table) else inst) for inst in insts]
+
+    def _pk_query(self, count: int):
+        pk_primary = self.table.meta.pk_primary
+        if not pk_primary:
+            raise TypeError("Table {} has no primary key".format(self.table.__name__))
+        param = pypika.terms.Parameter(self.dialect.placeholder)
         return (
             self.dialect.query_builder
             .from_(self.table.meta.pk_table)
             .delete()
-            .where((pk_field @ ids).pk_frag)
+            .where(pk_primary.isin([param] * count))
         )
 
 
+def _delete_one_sql(dialect: Type[Dialect], table: Type[Table], names: Tuple[str, ...], nulls: Tuple[str, ...]) -> str:
+    # The statement only depends on which fields are being compared to values and which are null,
+    # so it can be shared by all instances of the table with the same shape.
+    key = (DeleteOneQuery, dialect, names, nulls)
+    cache = table.meta.query_cache
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    pk_table = table.meta.pk_table
+    param = pypika.terms.Parameter(dialect.placeholder)
+    query: QueryBuilder = dialect.query_builder.from_(pk_table).delete()
+    for name in names:
+        query = query.where(pk_table.field(name) == param)
+    for name in nulls:
+        query = query.where(pk_table.field(name).isnull())
+    sql = cache[key] = str(query)
+    return sql
+
+
 class DeleteOneQuery(_Query[_TTable]):
     """
     Representation of a `DELETE` SQL query that compares all fields, for tables with no primary key.
+
+    The statement is parameterised, and reused for all instances of the table with the same null
+    fields.
     """
 
     def __init__(self, dialect: Type[Dialect], inst: _TTable):
         super().__init__(dialect, inst.__class__)
         self.inst = inst
-        self.pk_query = self._pk_query()
-
-    def _pk_query(self):
-        query: QueryBuilder = (
-            self.dialect.query_builder
-            .from_(self.table.meta.pk_table)
-            .delete()
-        )
-        for field in self.table.meta.fields.values():
-            query = query.where(field == field.encode(getattr(self.inst, field.name)))
-        return query
+        names: List[str] = []
+        nulls: List[str] = []
+        params: List[Any] = []
+        for name, field in self.table.meta.fields.items():
+            value = field.encode(getattr(inst, name))
+            if value is None:
+                # Nulls never compare equal, so need matching with `IS NULL` instead.
+                nulls.append(name)
+            else:
+                names.append(name)
+                params.append(value)
+        self.params = params
+        self._sql = _delete_one_sql(dialect, self.table, tuple(names), tuple(nulls))
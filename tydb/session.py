@@ -2,25 +2,31 @@
 Sessions represent the high-level interface to interact with data in a database.
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
 from typing import (
-    Any, Awaitable, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union, overload,
+    Any, AsyncIterator, Awaitable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar,
+    Union, overload,
 )
 
-from .api import AsyncConnection, Connection
+import pypika.terms
+
+from .api import AsyncConnection, AsyncCursor, Connection, Cursor
 from .dialects import Dialect
 from .fields import Nullable
 from .models import _RefSpec, BoundCollection, BoundReference, Default, Expr, Field, Table
 from .queries import (
-    AsyncInsertQuery, AsyncSelectQuery, AsyncSelectQueryResult, CreateTableQuery, DeleteQuery,
-    DeleteOneQuery, DropTableQuery, InsertQuery, SelectQuery, SelectQueryResult, _SelectQueryResult,
+    AsyncInsertQuery, AsyncSelectQuery, AsyncSelectQueryResult, BatchQuery, CreateTableQuery,
+    DeleteQuery, DeleteOneQuery, DropTableQuery, InsertQuery, SelectQuery, SelectQueryResult,
+    _Query, _SelectQueryResult,
 )
 from .utils import maybe_await, resolve_late_descriptors
 
 
 _T = TypeVar("_T")
 _TConnection = TypeVar("_TConnection", Connection, AsyncConnection)
+_TSession = TypeVar("_TSession", bound="_Session[Any]")
 _TTable = TypeVar("_TTable", bound=Table)
 _MaybeAsync = Union[_T, Awaitable[_T]]
 
@@ -28,8 +34,12 @@ _MaybeAsync = Union[_T, Awaitable[_T]]
 LOG = logging.getLogger(__name__)
 
 
-class _OmitValue(Exception):
-    pass
+# Marker returned by `_Session._create_value` for a value that should be left out of the query.
+_OMIT = object()
+
+# Maximum number of rows handled by a single query in bulk operations (`load_many`, `create_many`,
+# `remove` and `delete`), to stay within the database's limit on parameters per statement.
+BATCH_SIZE = 500
 
 
 class _Session(Generic[_TConnection]):
@@ -53,8 +63,15 @@ class _Session(Generic[_TConnection]):
         """
         raise NotImplementedError
 
+    def _batch(self, queries: List[_Query[Any]]) -> List[_Query[Any]]:
+        # Send multiple statements in one go if the dialect allows, saving round trips.
+        if self.dialect.multi_statement and len(queries) > 1:
+            return [BatchQuery(self.dialect, *queries)]
+        else:
+            return queries
+
     def _select_joins(self, table: Type[_TTable], *joins: _RefSpec, auto_join: bool = False):
-        return tuple(table.meta.walk_refs()) if auto_join else joins
+        return table.meta.auto_joins if auto_join else joins
 
     def _select_ref(
         self, table: Union[Type[_TTable], BoundCollection[_TTable]], where: Optional[Expr] = None,
@@ -79,7 +96,7 @@ class _Session(Generic[_TConnection]):
         raise NotImplementedError
 
     def _get_one(self, results: List[_TTable]) -> _TTable:
-        if len(results) == 0:
+        if not results:
             raise LookupError("Expected one record but none found")
         elif len(results) > 1:
             raise LookupError("Expected one result but multiple found")
@@ -115,18 +132,16 @@ class _Session(Generic[_TConnection]):
         return (where, joins)
 
     @overload
-    def _load_one(self, results: Any, bind: Nullable.BoundReference[_TTable]) -> Optional[_TTable]: ...
+    def _load_one(self, result: Any, bind: Nullable.BoundReference[_TTable]) -> Optional[_TTable]: ...
     @overload
-    def _load_one(self, results: Any, bind: BoundReference[_TTable]) -> _TTable: ...
+    def _load_one(self, result: Any, bind: BoundReference[_TTable]) -> _TTable: ...
 
-    def _load_one(self, results: List[_TTable], bind: BoundReference[_TTable]) -> Optional[_TTable]:
-        if results:
-            bind.value = results[0]
-            return bind.value
-        elif isinstance(bind, Nullable.BoundReference):
-            return None
+    def _load_one(self, result: Optional[_TTable], bind: BoundReference[_TTable]) -> Optional[_TTable]:
+        if result is not None:
+            bind.value = result
+            return result
         else:
-            raise LookupError("Expected one record but none found")
+            return bind._missing()
 
     @overload
     def load(self, bind: Nullable.BoundReference[_TTable], *joins: Any, auto_join: Any = ...) -> Optional[_TTable]: ...
@@ -139,19 +154,59 @@ class _Session(Generic[_TConnection]):
         """
         raise NotImplementedError
 
-    def _create_value(self, field: Field, value: Any, dialect: Type[Dialect]):
+    def _load_many_groups(self, *binds: BoundReference[Any]) -> List[Tuple[Field[Any], List[BoundReference[Any]]]]:
+        # Group unfetched references by the field they point to, each needing a single query.
+        groups: Dict[Tuple[Type[Table], str], Tuple[Field[Any], List[BoundReference[Any]]]] = {}
+        for bind in binds:
+            if bind.fetched:
+                continue
+            foreign = bind.ref.field.foreign
+            assert foreign
+            if getattr(bind.inst, bind.ref.field.name) is None:
+                bind.value = bind._missing()
+                continue
+            key = (foreign.owner, foreign.name)
+            try:
+                group = groups[key]
+            except KeyError:
+                group = groups[key] = (foreign, [])
+            group[1].append(bind)
+        return list(groups.values())
+
+    def _load_many_wheres(self, foreign: Field[Any], binds: List[BoundReference[Any]]) -> List[Expr]:
+        values = list({getattr(bind.inst, bind.ref.field.name): None for bind in binds})
+        return [foreign @ values[pos:pos + BATCH_SIZE] for pos in range(0, len(values), BATCH_SIZE)]
+
+    def _load_many_set(self, foreign: Field[Any], binds: List[BoundReference[Any]], results: Iterable[Table]):
+        found = {getattr(inst, foreign.name): inst for inst in results}
+        for bind in binds:
+            value = found.get(getattr(bind.inst, bind.ref.field.name))
+            bind.value = bind._missing() if value is None else value
+
+    def load_many(self, *binds: BoundReference[Any]) -> _MaybeAsync[None]:
+        """
+        Perform a `SELECT ... WHERE ... IN` query for each related table (or per batch of
+        `BATCH_SIZE` keys), fetching the objects for several references at once.
+
+        Raises `LookupError` if a non-nullable reference's object is missing.
+        """
+        raise NotImplementedError
+
+    def _create_value(
+        self, field: Field, value: Any, server_default: Optional[pypika.terms.Term], now: Optional[datetime] = None,
+    ):
         if value is None:
             if Nullable.is_nullable(type(field)):
                 value = None
             elif field.default is Default.NONE:
                 raise KeyError(field.name)
             elif field.default is Default.SERVER:
-                if dialect.server_default:
-                    value = dialect.server_default
+                if server_default:
+                    value = server_default
                 else:
-                    raise _OmitValue
+                    return _OMIT
             elif field.default is Default.TIMESTAMP_NOW:
-                value = datetime.now().astimezone()
+                value = now or datetime.now().astimezone()
             else:
                 value = field.default
         if isinstance(value, Table):
@@ -159,39 +214,57 @@ class _Session(Generic[_TConnection]):
             value = getattr(value, field.foreign.name)
         return value
 
-    def _create_fields(
-        self, dialect: Type[Dialect], table: Type[_TTable], **data: Any,
-    ) -> Tuple[List[Any], List[Field[Any]]]:
-        fields: List[Field[Any]] = []
+    def _create_column(
+        self, field: Field, values: List[Any], server_default: Optional[pypika.terms.Term], now: datetime,
+    ) -> List[Any]:
+        # Like `_create_value` for a whole column: the default only needs resolving once, and only
+        # foreign key fields need checking for table instances.
+        if any(value is None for value in values):
+            default = self._create_value(field, None, server_default, now)
+            if default is _OMIT:
+                raise RuntimeError("Can't omit values during bulk insert")
+            values = [default if value is None else value for value in values]
+        if field.foreign:
+            values = [
+                self._create_value(field, value, server_default) if isinstance(value, Table) else value
+                for value in values
+            ]
+        return values
+
+    def _create_fields(self, table: Type[_TTable], **data: Any) -> Tuple[List[Any], Sequence[Field[Any]]]:
+        create_value = self._create_value
+        get = data.get
+        server_default = self.dialect.server_default
+        fields = table.meta.field_list
         row = []
-        for name, field in table.meta.fields.items():
-            try:
-                value = self._create_value(field, data.get(name), self.dialect)
-            except _OmitValue:
-                continue
+        for field in fields:
+            value = get(field.name)
+            # Only missing values (needing defaults) and instances (needing their key) need handling.
+            if value is None or isinstance(value, Table):
+                value = create_value(field, value, server_default)
             row.append(value)
-            fields.append(field)
-        return row, fields
+        if not any(value is _OMIT for value in row):
+            # Every field has a value, so the table's own field list can be used as is.
+            return row, fields
+        pairs = [(value, field) for value, field in zip(row, fields) if value is not _OMIT]
+        return [value for value, _ in pairs], [field for _, field in pairs]
 
     def _bulk_create_fields(
-        self, dialect: Type[Dialect], fields: Sequence[Field], *datas: Sequence[Any],
+        self, fields: Sequence[Field], *datas: Sequence[Any],
     ) -> Tuple[Type[Table], List[List[Any]]]:
         if not fields:
             raise IndexError("At least one field required")
         table = fields[0].owner
         if any(field.owner is not table for field in fields[1:]):
             raise RuntimeError("All fields must be on the same table")
-        rows: List[List[Any]] = []
-        for data in datas:
-            row = []
-            for field, value in zip(fields, data):
-                try:
-                    value = self._create_value(field, value, self.dialect)
-                except _OmitValue:
-                    raise RuntimeError("Can't omit values during bulk insert")
-                row.append(value)
-            rows.append(row)
-        return table, rows
+        # Stage the values column by column, so each field's handling is looked up once.
+        columns: List[List[Any]] = []
+        server_default = self.dialect.server_default
+        # Use the same timestamp for all rows, rather than fetching the time for every value.
+        now = datetime.now().astimezone()
+        for pos, field in enumerate(fields):
+            columns.append(self._create_column(field, [data[pos] for data in datas], server_default, now))
+        return table, columns
 
     def create(self, table: Type[_TTable], **data: Any) -> Optional[int]:
         """
@@ -201,6 +274,38 @@ class _Session(Generic[_TConnection]):
         """
         raise NotImplementedError
 
+    def _create_many_batches(
+        self, table: Type[_TTable], *data: Dict[str, Any],
+    ) -> List[Tuple[Sequence[Field[Any]], List[List[Any]]]]:
+        # Rows that leave out different fields (for server defaults) need separate queries.
+        groups: Dict[Tuple[str, ...], Tuple[Sequence[Field[Any]], List[List[Any]]]] = {}
+        for item in data:
+            row, fields = self._create_fields(table, **item)
+            key = tuple(field.name for field in fields)
+            try:
+                groups[key][1].append(row)
+            except KeyError:
+                groups[key] = (fields, [row])
+        batches: List[Tuple[Sequence[Field[Any]], List[List[Any]]]] = []
+        for fields, rows in groups.values():
+            if not fields:
+                # Multiple rows can't be written without any columns, so add them one at a time.
+                batches.extend((fields, [row]) for row in rows)
+                continue
+            for pos in range(0, len(rows), BATCH_SIZE):
+                batches.append((fields, rows[pos:pos + BATCH_SIZE]))
+        return batches
+
+    def create_many(self, table: Type[_TTable], *data: Dict[str, Any]) -> _MaybeAsync[None]:
+        """
+        Perform `INSERT` queries to add multiple records to the given table, each described by a
+        mapping of field names to values as with `create`.
+
+        Records setting the same fields are combined into a single query, except for records that
+        leave every field to a server default, which are added one at a time.
+        """
+        raise NotImplementedError
+
     def bulk_create(self, fields: Sequence[Field], *data: Sequence[Any]) -> None:
         """
         Perform a bulk `INSERT` query to add multiple records to the given table.
@@ -217,43 +322,199 @@ class _Session(Generic[_TConnection]):
         """
         raise NotImplementedError
 
-    def _remove_query(self, inst: Table, *insts: Table) -> Union[DeleteOneQuery, DeleteQuery]:
-        table = inst.__class__
-        if table.meta.primary:
-            return DeleteQuery(self.dialect, table, inst, *insts)
-        elif not insts:
-            return DeleteOneQuery(self.dialect, inst)
-        else:
-            raise RuntimeError("Can only delete single instance of table without primary key")
+    def _remove_queries(self, *insts: Table) -> List[Union[DeleteOneQuery, DeleteQuery]]:
+        groups: Dict[Type[Table], List[Table]] = {}
+        for inst in insts:
+            groups.setdefault(inst.__class__, []).append(inst)
+        queries: List[Union[DeleteOneQuery, DeleteQuery]] = []
+        for table, group in groups.items():
+            if table.meta.primary:
+                queries.extend(self._delete_queries(table, *group))
+            elif len(group) == 1:
+                queries.append(DeleteOneQuery(self.dialect, group[0]))
+            else:
+                raise RuntimeError("Can only delete single instance of table without primary key")
+        return queries
+
+    def _delete_queries(self, table: Type[Table], *ids: Any) -> List[DeleteQuery]:
+        return [
+            DeleteQuery(self.dialect, table, *ids[pos:pos + BATCH_SIZE])
+            for pos in range(0, len(ids), BATCH_SIZE)
+        ]
 
     def remove(self, *insts: Table) -> _MaybeAsync[None]:
         """
-        Perform a `DELETE` query that removes the given instances.
+        Perform `DELETE` queries that remove the given instances, one per table (or per batch of
+        `BATCH_SIZE` instances).
         """
         raise NotImplementedError
 
     def delete(self, table: Type[Table], *ids: Any) -> _MaybeAsync[None]:
         """
-        Perform a `DELETE` query that removes rows of the given table by primary key value.
+        Perform a `DELETE` query that removes rows of the given table by primary key value, split
+        into batches of `BATCH_SIZE` values.
         """
         raise NotImplementedError
 
+    def batch(self) -> "_Batch[Any]":
+        """
+        Make a context manager that collects `create`, `remove` and `delete` calls, and performs
+        them in order on exit, combining consecutive calls for the same table where possible.
+
+        ```python
+        with sess.batch() as batch:
+            for name in names:
+                batch.create(Model, name=name)
+        ```
+        """
+        raise NotImplementedError
+
+
+class _Batch(Generic[_TSession]):
+    """
+    Queue of writes for a session.
+
+    Writes are performed in the order they were queued, with consecutive calls of the same kind
+    for the same table (and for creates, setting the same fields) combined into a single query of
+    up to `BATCH_SIZE` rows.  Nothing is written if the context exits with an exception.
+
+    Writes aren't wrapped in a transaction -- if a flush fails part way, each query that succeeded
+    is removed from the queue and the rest are left queued, and the connection's own transaction
+    handling decides what happens to those that have been performed.
+    """
+
+    def __init__(self, sess: _TSession):
+        self.sess = sess
+        self._ops: List[Tuple[str, Type[Table], Any]] = []
+
+    def create(self, table: Type[Table], **data: Any) -> None:
+        """
+        Queue a record to add, as with `Session.create` (though the primary key isn't available).
+        """
+        self._ops.append(("create", table, data))
+
+    def remove(self, *insts: Table) -> None:
+        """
+        Queue instances to remove, as with `Session.remove`.
+        """
+        self._ops.extend(("remove", inst.__class__, inst) for inst in insts)
+
+    def delete(self, table: Type[Table], *ids: Any) -> None:
+        """
+        Queue rows to remove by primary key value, as with `Session.delete`.
+        """
+        self._ops.extend(("delete", table, id) for id in ids)
+
+    def _create_key(self, table: Type[Table], data: Dict[str, Any]) -> Tuple[str, ...]:
+        _, fields = self.sess._create_fields(table, **data)
+        return tuple(field.name for field in fields)
+
+    def _next_run(self) -> Tuple[str, Type[Table], List[Any]]:
+        # Take as many writes from the front of the queue as can be performed by a single query,
+        # so that each one can be dropped from the queue once its query succeeds.
+        ops = self._ops
+        kind, table, item = ops[0]
+        items = [item]
+        if kind == "create":
+            key = self._create_key(table, item)
+            if not key:
+                # Multiple rows can't be written without any columns.
+                return (kind, table, items)
+        elif kind == "remove" and not table.meta.primary:
+            # Instances of tables without a primary key can only be removed one at a time.
+            return (kind, table, items)
+        for next_kind, next_table, next_item in ops[1:BATCH_SIZE]:
+            if next_kind != kind or next_table is not table:
+                break
+            if kind == "create" and self._create_key(table, next_item) != key:
+                break
+            items.append(next_item)
+        return (kind, table, items)
+
+
+class Batch(_Batch["Session"]):
+    """
+    Queue of writes for a `Session`, performed when leaving the context or calling `flush`.
+    """
+
+    def flush(self) -> None:
+        """
+        Perform all queued writes.
+        """
+        while self._ops:
+            kind, table, items = self._next_run()
+            if kind == "create":
+                self.sess.create_many(table, *items)
+            elif kind == "remove":
+                self.sess.remove(*items)
+            else:
+                self.sess.delete(table, *items)
+            del self._ops[:len(items)]
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.flush()
+
+
+class AsyncBatch(_Batch["AsyncSession"]):
+    """
+    Queue of writes for an `AsyncSession`, performed when leaving the context or calling `flush`.
+    """
+
+    async def flush(self) -> None:
+        """
+        Perform all queued writes.
+        """
+        while self._ops:
+            kind, table, items = self._next_run()
+            if kind == "create":
+                await self.sess.create_many(table, *items)
+            elif kind == "remove":
+                await self.sess.remove(*items)
+            else:
+                await self.sess.delete(table, *items)
+            del self._ops[:len(items)]
+
+    async def __aenter__(self) -> "AsyncBatch":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            await self.flush()
+
 
 class Session(_Session[Connection]):
     """
     Wrapper around a DB-API `Connection`.
+
+    Queries other than `select` share a single cursor, so a session shouldn't be used by multiple
+    threads at once.
     """
 
+    def __init__(self, conn: Connection, dialect: Type[Dialect] = Dialect):
+        super().__init__(conn, dialect)
+        self._cursor: Optional[Cursor] = None
+
+    def _get_cursor(self) -> Cursor:
+        # Shared by queries whose results are consumed before returning -- `select()` hands its
+        # cursor to the caller, so needs its own.
+        if self._cursor is None:
+            self._cursor = self.conn.cursor()
+        return self._cursor
+
     def setup(self, *tables: Type[Table]) -> None:
         resolve_late_descriptors(*tables)
-        queries = (CreateTableQuery(self.dialect, table) for table in tables)
-        cursor = self.conn.cursor()
+        queries = self._batch([CreateTableQuery(self.dialect, table) for table in tables])
+        cursor = self._get_cursor()
         for query in queries:
             query.execute(cursor)
 
     def destroy(self, *tables: Type[Table]) -> None:
-        queries = (DropTableQuery(self.dialect, table) for table in tables)
-        cursor = self.conn.cursor()
+        queries = self._batch([DropTableQuery(self.dialect, table) for table in tables])
+        cursor = self._get_cursor()
         for query in queries:
             query.execute(cursor)
 
@@ -271,18 +532,17 @@ class Session(_Session[Connection]):
     ) -> _TTable:
         joins = self._select_joins(table, *joins, auto_join=auto_join)
         query = SelectQuery(self.dialect, table, where, *joins, limit=2)
-        cursor = self.conn.cursor()
-        results = list(query.execute(cursor))
-        return self._get_one(results)
+        cursor = self._get_cursor()
+        return self._get_one(query.execute_limited(cursor))
 
     def first(
         self, table: Type[_TTable], where: Optional[Expr] = None, *joins: _RefSpec, auto_join: bool = False,
     ) -> Optional[_TTable]:
         joins = self._select_joins(table, *joins, auto_join=auto_join)
         query = SelectQuery(self.dialect, table, where, *joins, limit=1)
-        cursor = self.conn.cursor()
-        results = query.execute(cursor)
-        return next(results, None)
+        cursor = self._get_cursor()
+        results = query.execute_limited(cursor)
+        return results[0] if results else None
 
     @overload
     def load(self, bind: Nullable.BoundReference[_TTable], *joins: Any, auto_join: Any = ...) -> Optional[_TTable]: ...
@@ -290,41 +550,53 @@ class Session(_Session[Connection]):
     def load(self, bind: BoundReference[_TTable], *joins: Any, auto_join: Any = ...) -> _TTable: ...
 
     def load(self, bind: BoundReference[_TTable], *joins: _RefSpec, auto_join: bool = False) -> Optional[_TTable]:
-        try:
+        if bind.fetched:
             return bind.value
-        except AttributeError:
-            pass
         where, joins = self._load_where(bind, *joins, auto_join=auto_join)
         query = SelectQuery(self.dialect, bind.ref.table, where, *joins, limit=1)
-        cursor = self.conn.cursor()
-        results = list(query.execute(cursor))
-        return self._load_one(results, bind)
+        cursor = self._get_cursor()
+        results = query.execute_limited(cursor)
+        return self._load_one(results[0] if results else None, bind)
+
+    def load_many(self, *binds: BoundReference[Any]) -> None:
+        cursor = self._get_cursor()
+        for foreign, group in self._load_many_groups(*binds):
+            results: List[Table] = []
+            for where in self._load_many_wheres(foreign, group):
+                query = SelectQuery(self.dialect, foreign.owner, where)
+                results.extend(query.execute(cursor))
+            self._load_many_set(foreign, group, results)
 
     def create(self, table: Type[_TTable], **data: Any) -> Optional[int]:
-        row, fields = self._create_fields(self.dialect, table, **data)
+        row, fields = self._create_fields(table, **data)
         query = InsertQuery(self.dialect, table, row, fields=fields)
-        cursor = self.conn.cursor()
+        cursor = self._get_cursor()
         return query.execute(cursor)
 
+    def create_many(self, table: Type[_TTable], *data: Dict[str, Any]) -> None:
+        for fields, rows in self._create_many_batches(table, *data):
+            query = InsertQuery(self.dialect, table, *rows, fields=fields)
+            cursor = self._get_cursor()
+            query.execute(cursor)
+
     def bulk_create(self, fields: Sequence[Field], *data: Sequence[Any]) -> None:
-        table, rows = self._bulk_create_fields(self.dialect, fields, *data)
-        query = InsertQuery(self.dialect, table, *rows, fields=fields)
-        cursor = self.conn.cursor()
+        table, columns = self._bulk_create_fields(fields, *data)
+        query = InsertQuery(self.dialect, table, fields=fields, columns=columns)
+        cursor = self._get_cursor()
         query.execute(cursor)
 
     def remove(self, *insts: Table) -> None:
-        if not insts:
-            return
-        query = self._remove_query(*insts)
-        cursor = self.conn.cursor()
-        query.execute(cursor)
+        for query in self._remove_queries(*insts):
+            cursor = self._get_cursor()
+            query.execute(cursor)
 
     def delete(self, table: Type[Table], *ids: Any) -> None:
-        if not ids:
-            return
-        query = DeleteQuery(self.dialect, table, *ids)
-        cursor = self.conn.cursor()
-        query.execute(cursor)
+        for query in self._delete_queries(table, *ids):
+            cursor = self._get_cursor()
+            query.execute(cursor)
+
+    def batch(self) -> Batch:
+        return Batch(self)
 
 
 class AsyncSession(_Session[AsyncConnection]):
@@ -334,18 +606,38 @@ class AsyncSession(_Session[AsyncConnection]):
     Each call to a connection method will be `await`ed if it returns an awaitable object.
     """
 
+    def __init__(self, conn: AsyncConnection, dialect: Type[Dialect] = Dialect):
+        super().__init__(conn, dialect)
+        self._cursors: List[AsyncCursor] = []
+
+    @asynccontextmanager
+    async def _pooled_cursor(self) -> AsyncIterator[AsyncCursor]:
+        # Cursors are kept for reuse by queries whose results are consumed before returning, with
+        # each query taking its own so that concurrent ones don't interfere.  `select()` hands its
+        # cursor to the caller, so needs a fresh one.
+        cursors = self._cursors
+        cursor = cursors.pop() if cursors else await maybe_await(self.conn.cursor())
+        try:
+            yield cursor
+        except BaseException:
+            # The cursor may have been interrupted mid-query (including by cancellation), so
+            # don't hand it to another query.
+            await maybe_await(cursor.close())
+            raise
+        cursors.append(cursor)
+
     async def setup(self, *tables: Type[Table]) -> None:
         resolve_late_descriptors(*tables)
-        queries = (CreateTableQuery(self.dialect, table) for table in tables)
-        cursor = await maybe_await(self.conn.cursor())
-        for query in queries:
-            await query.execute(cursor)
+        queries = self._batch([CreateTableQuery(self.dialect, table) for table in tables])
+        async with self._pooled_cursor() as cursor:
+            for query in queries:
+                await query.execute(cursor)
 
     async def destroy(self, *tables: Type[Table]) -> None:
-        queries = (DropTableQuery(self.dialect, table) for table in tables)
-        cursor = await maybe_await(self.conn.cursor())
-        for query in queries:
-            await query.execute(cursor)
+        queries = self._batch([DropTableQuery(self.dialect, table) for table in tables])
+        async with self._pooled_cursor() as cursor:
+            for query in queries:
+                await query.execute(cursor)
 
     async def select(
         self, table: Union[Type[_TTable], BoundCollection[_TTable]],
@@ -361,8 +653,8 @@ class AsyncSession(_Session[AsyncConnection]):
     ) -> _TTable:
         joins = self._select_joins(table, *joins, auto_join=auto_join)
         query = AsyncSelectQuery(self.dialect, table, where, *joins, limit=2)
-        cursor = await maybe_await(self.conn.cursor())
-        results = [result async for result in await query.execute(cursor)]
+        async with self._pooled_cursor() as cursor:
+            results = await query.execute_limited(cursor)
         return self._get_one(results)
 
     async def first(
@@ -370,12 +662,9 @@ class AsyncSession(_Session[AsyncConnection]):
     ) -> Optional[_TTable]:
         joins = self._select_joins(table, *joins, auto_join=auto_join)
         query = AsyncSelectQuery(self.dialect, table, where, *joins, limit=1)
-        cursor = await maybe_await(self.conn.cursor())
-        results = await query.execute(cursor)
-        async for result in results:
-            return result
-        else:
-            return None
+        async with self._pooled_cursor() as cursor:
+            results = await query.execute_limited(cursor)
+            return results[0] if results else None
 
     @overload
     async def load(
@@ -387,38 +676,56 @@ class AsyncSession(_Session[AsyncConnection]):
     async def load(
         self, bind: BoundReference[_TTable], *joins: _RefSpec, auto_join: bool = False,
     ) -> Optional[_TTable]:
-        try:
+        if bind.fetched:
             return bind.value
-        except AttributeError:
-            pass
         where, joins = self._load_where(bind, *joins, auto_join=auto_join)
         query = AsyncSelectQuery(self.dialect, bind.ref.table, where, *joins, limit=1)
-        cursor = await maybe_await(self.conn.cursor())
-        results = [result async for result in await query.execute(cursor)]
-        return self._load_one(results, bind)
+        async with self._pooled_cursor() as cursor:
+            results = await query.execute_limited(cursor)
+        return self._load_one(results[0] if results else None, bind)
+
+    async def load_many(self, *binds: BoundReference[Any]) -> None:
+        groups = self._load_many_groups(*binds)
+        found: List[List[Table]] = []
+        async with self._pooled_cursor() as cursor:
+            for foreign, group in groups:
+                results: List[Table] = []
+                for where in self._load_many_wheres(foreign, group):
+                    query = AsyncSelectQuery(self.dialect, foreign.owner, where)
+                    results.extend([inst async for inst in await query.execute(cursor)])
+                found.append(results)
+        for (foreign, group), results in zip(groups, found):
+            self._load_many_set(foreign, group, results)
 
     async def create(self, table: Type[_TTable], **data: Any) -> Optional[int]:
-        row, fields = self._create_fields(self.dialect, table, **data)
+        row, fields = self._create_fields(table, **data)
         query = AsyncInsertQuery(self.dialect, table, row, fields=fields)
-        cursor = await maybe_await(self.conn.cursor())
-        return await query.execute(cursor)
+        async with self._pooled_cursor() as cursor:
+            return await query.execute(cursor)
+
+    async def create_many(self, table: Type[_TTable], *data: Dict[str, Any]) -> None:
+        async with self._pooled_cursor() as cursor:
+            for fields, rows in self._create_many_batches(table, *data):
+                query = AsyncInsertQuery(self.dialect, table, *rows, fields=fields)
+                await query.execute(cursor)
 
     async def bulk_create(self, fields: Sequence[Field], *data: Sequence[Any]) -> None:
-        table, rows = self._bulk_create_fields(self.dialect, fields, *data)
-        query = AsyncInsertQuery(self.dialect, table, *rows, fields=fields)
-        cursor = await maybe_await(self.conn.cursor())
-        await query.execute(cursor)
+        table, columns = self._bulk_create_fields(fields, *data)
+        query = AsyncInsertQuery(self.dialect, table, fields=fields, columns=columns)
+        async with self._pooled_cursor() as cursor:
+            await query.execute(cursor)
 
     async def remove(self, *insts: Table) -> None:
-        if not insts:
-            return
-        query = self._remove_query(*insts)
-        cursor = await maybe_await(self.conn.cursor())
-        await query.execute(cursor)
+        queries = self._remove_queries(*insts)
+        async with self._pooled_cursor() as cursor:
+            for query in queries:
+                await query.execute(cursor)
 
     async def delete(self, table: Type[Table], *ids: Any) -> None:
-        if not ids:
-            return
-        query = DeleteQuery(self.dialect, table, *ids)
-        cursor = await maybe_await(self.conn.cursor())
-        await query.execute(cursor)
+        queries = self._delete_queries(table, *ids)
+        async with self._pooled_cursor() as cursor:
+            for query in queries:
+                await query.execute(cursor)
+
+    def batch(self) -> AsyncBatch:
+        return AsyncBatch(self)
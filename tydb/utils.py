@@ -2,22 +2,35 @@
 Miscellaneous helper methods.
 """
 
+from functools import lru_cache
 from inspect import isawaitable
+from types import CoroutineType, GeneratorType
 from typing import Any, Awaitable, Type, TypeVar, Union
 
-from .models import _Descriptor
+from .models import _Descriptor, Table
 
 
 _T = TypeVar("_T")
 
 
+@lru_cache(maxsize=None)
+def _awaitable_type(kind: Type[Any]) -> bool:
+    return issubclass(kind, Awaitable)
+
+
 async def maybe_await(result: Union[Awaitable[_T], _T]) -> _T:
     """
     Handle a potentially-awaitable return value by `await`ing it if it's an `Awaitable`.
 
     Can be used with functions that may or may not be coroutines.
     """
-    if isawaitable(result):
+    kind = type(result)
+    if kind is GeneratorType:
+        # Generator-based coroutines are marked per object, so can't be decided by type.
+        awaitable = isawaitable(result)
+    else:
+        awaitable = kind is CoroutineType or _awaitable_type(kind)
+    if awaitable:
         return await result
     else:
         return result
@@ -32,3 +45,5 @@ def resolve_late_descriptors(*targets: Type[Any]):
         for attr, value in vars(target).items():
             if isinstance(value, _Descriptor) and not hasattr(value, "owner"):
                 value.__set_name__(target, attr)
+        if issubclass(target, Table):
+            target.meta.reset()